@@ -5,8 +5,21 @@ load_dotenv()
 
 class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4")
+    # Default must be a model that accepts json_schema response_format;
+    # plain gpt-4 rejects it
+    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
+    # Recommendations are 4 short strings; a small-tier model is plenty
+    # and is several times cheaper and faster than the generation model
+    OPENAI_RECS_MODEL: str = os.getenv("OPENAI_RECS_MODEL", "gpt-4o-mini")
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    # Sample-data generations at or above this size go through the
+    # discounted OpenAI Batch API instead of a live completion
+    OPENAI_BATCH_THRESHOLD: int = int(os.getenv("OPENAI_BATCH_THRESHOLD", "100"))
+    OPENAI_BATCH_POLL_SECONDS: int = int(os.getenv("OPENAI_BATCH_POLL_SECONDS", "30"))
+    OPENAI_BATCH_TIMEOUT_SECONDS: int = int(os.getenv("OPENAI_BATCH_TIMEOUT_SECONDS", "3600"))
+    # Cap on concurrent OpenAI-backed analyses in /analyze-batch, to stay
+    # inside the account's RPM/TPM limits
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "5"))
 
 settings = Settings()
\ No newline at end of file
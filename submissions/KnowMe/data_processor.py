@@ -1,250 +1,312 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from models import InputDataPoint, ChartDataPoint, ChartData
-import re
-from collections import Counter
-
-class DataProcessor:
-    """Processes input data and prepares it for OpenAI analysis"""
-    
-    def __init__(self):
-        self.mental_health_keywords = {
-            'anxiety': ['anxiety', 'worried', 'nervous', 'panic', 'stress', 'overwhelmed'],
-            'depression': ['depressed', 'sad', 'down', 'hopeless', 'empty', 'worthless'],
-            'stress': ['stressed', 'pressure', 'deadline', 'overwhelmed', 'burnout', 'exhausted']
-        }
-    
-    def process_data(self, data_points: List[InputDataPoint]) -> Dict[str, Any]:
-        """Process raw data points and extract insights"""
-        df = pd.DataFrame([dp.dict() for dp in data_points])
-        
-        # Convert timestamp to datetime if it's not already
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # Sort by timestamp
-        df = df.sort_values('timestamp')
-        
-        # Calculate daily aggregates
-        daily_data = self._calculate_daily_aggregates(df)
-        
-        # Extract mental health indicators
-        mental_health_indicators = self._extract_mental_health_indicators(df)
-        
-        # Analyze engagement patterns
-        engagement_patterns = self._analyze_engagement_patterns(df)
-        
-        # Extract topic analysis
-        topic_analysis = self._analyze_topics(df)
-        
-        # Calculate wellbeing metrics
-        wellbeing_metrics = self._calculate_wellbeing_metrics(df)
-        
-        return {
-            'daily_data': daily_data,
-            'mental_health_indicators': mental_health_indicators,
-            'engagement_patterns': engagement_patterns,
-            'topic_analysis': topic_analysis,
-            'wellbeing_metrics': wellbeing_metrics,
-            'raw_data': df
-        }
-    
-    def _calculate_daily_aggregates(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate daily aggregated metrics"""
-        df['date'] = df['timestamp'].dt.date
-        
-        daily_agg = df.groupby('date').agg({
-            'sentiment_score': 'mean',
-            'engagement_score': 'mean',
-            'wellbeing_index': 'mean',
-            'likes_count': 'sum',
-            'comments_count': 'sum',
-            'shares_count': 'sum',
-            'time_spent_on_post': 'sum',
-            'night_usage_minutes': 'sum'
-        }).reset_index()
-        
-        return daily_agg.to_dict('records')
-    
-    def _extract_mental_health_indicators(self, df: pd.DataFrame) -> Dict[str, float]:
-        """Extract mental health category percentages"""
-        total_posts = len(df)
-        categories = {'Anxiety': 0, 'Stress': 0, 'Depression': 0}
-        
-        for _, row in df.iterrows():
-            text = str(row['caption_text']).lower()
-            hashtags = str(row['hashtags']).lower()
-            combined_text = f"{text} {hashtags}"
-            
-            # Check for anxiety indicators
-            if any(keyword in combined_text for keyword in self.mental_health_keywords['anxiety']):
-                categories['Anxiety'] += 1
-            
-            # Check for stress indicators
-            if any(keyword in combined_text for keyword in self.mental_health_keywords['stress']):
-                categories['Stress'] += 1
-            
-            # Check for depression indicators
-            if any(keyword in combined_text for keyword in self.mental_health_keywords['depression']):
-                categories['Depression'] += 1
-        
-        # Convert to percentages
-        for category in categories:
-            categories[category] = (categories[category] / total_posts) * 100
-        
-        return categories
-    
-    def _analyze_engagement_patterns(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
-        """Analyze engagement vs mood patterns"""
-        patterns = []
-        
-        for _, row in df.iterrows():
-            patterns.append({
-                'likes': int(row['likes_count']),
-                'comments': int(row['comments_count']),
-                'emotional_tone': float(row['sentiment_score'])
-            })
-        
-        return patterns
-    
-    def _analyze_topics(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
-        """Extract stress-related words and their frequencies"""
-        all_text = []
-        
-        for _, row in df.iterrows():
-            # Combine caption and hashtags
-            text = f"{row['caption_text']} {row['hashtags']}"
-            all_text.append(text)
-        
-        # Extract words (simple tokenization)
-        words = []
-        for text in all_text:
-            # Remove special characters and split
-            clean_text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-            words.extend(clean_text.split())
-        
-        # Filter for stress-related words
-        stress_words = [
-            'workload', 'deadline', 'sleep', 'balance', 'family', 
-            'exercise', 'burnout', 'pressure', 'stress', 'tired',
-            'overwhelmed', 'anxious', 'worried', 'exhausted'
-        ]
-        
-        word_freq = Counter(words)
-        stress_word_freq = {word: word_freq[word] for word in stress_words if word in word_freq}
-        
-        # Sort by frequency and take top 7
-        sorted_words = sorted(stress_word_freq.items(), key=lambda x: x[1], reverse=True)[:7]
-        
-        return [{'word': word, 'frequency': freq} for word, freq in sorted_words]
-    
-    def _calculate_wellbeing_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate overall wellbeing metrics"""
-        avg_wellbeing = df['wellbeing_index'].mean()
-        avg_sentiment = df['sentiment_score'].mean()
-        avg_engagement = df['engagement_score'].mean()
-        
-        # Determine status based on wellbeing score
-        if avg_wellbeing >= 80:
-            status = "Excellent"
-        elif avg_wellbeing >= 60:
-            status = "Good"
-        elif avg_wellbeing >= 40:
-            status = "Stable"
-        else:
-            status = "Needs Attention"
-        
-        return {
-            'wellbeing_score': float(avg_wellbeing),
-            'sentiment_score': float(avg_sentiment),
-            'engagement_score': float(avg_engagement),
-            'status': status
-        }
-    
-    def prepare_chart_data(self, processed_data: Dict[str, Any]) -> Dict[str, ChartData]:
-        """Prepare data in the required chart format"""
-        daily_data = processed_data['daily_data']
-        mental_health = processed_data['mental_health_indicators']
-        engagement = processed_data['engagement_patterns']
-        topics = processed_data['topic_analysis']
-        wellbeing = processed_data['wellbeing_metrics']
-        
-        # Emotional trend chart
-        emotional_trend_data = [
-            ChartDataPoint(
-                date=str(day['date']),
-                sentiment_score=round(day['sentiment_score'], 1)
-            )
-            for day in daily_data
-        ]
-        
-        # Mental health categories chart
-        mental_health_data = [
-            ChartDataPoint(
-                category=category,
-                percentage=round(percentage, 1)
-            )
-            for category, percentage in mental_health.items()
-        ]
-        
-        # Engagement vs mood chart
-        engagement_data = [
-            ChartDataPoint(
-                likes=pattern['likes'],
-                comments=pattern['comments'],
-                emotional_tone=round(pattern['emotional_tone'], 1)
-            )
-            for pattern in engagement[:5]  # Limit to 5 data points for visualization
-        ]
-        
-        # Topics discussed chart
-        topics_data = [
-            ChartDataPoint(
-                word=topic['word'],
-                frequency=topic['frequency']
-            )
-            for topic in topics
-        ]
-        
-        # Wellbeing index chart
-        wellbeing_data = ChartData(
-            chart_type="gauge",
-            title="Overall Wellbeing Score",
-            data=[],
-            value=round(wellbeing['wellbeing_score'], 1),
-            range={"min": 0, "max": 100},
-            status=wellbeing['status']
-        )
-        
-        # Recommendations (will be generated by OpenAI)
-        recommendations_data = ChartData(
-            chart_type="text_cards",
-            title="Personalized Suggestions",
-            data=[]
-        )
-        
-        return {
-            'emotional_trend': ChartData(
-                chart_type="line",
-                title="Daily Sentiment Over Time",
-                data=emotional_trend_data
-            ),
-            'mental_health_categories': ChartData(
-                chart_type="pie",
-                title="Distribution of Anxiety/Stress/Depression Indicators",
-                data=mental_health_data
-            ),
-            'engagement_vs_mood': ChartData(
-                chart_type="scatter",
-                title="Engagement vs Mood",
-                data=engagement_data
-            ),
-            'topics_discussed': ChartData(
-                chart_type="word_cloud",
-                title="Top Stress-Related Words",
-                data=topics_data
-            ),
-            'wellbeing_index': wellbeing_data,
-            'recommendations': recommendations_data
-        }
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+from typing import List, Dict, Any
+from models import InputDataPoint, ChartDataPoint, ChartData
+import re
+
+# Column layout for the input DataFrame, derived once from the model
+_FIELDS = list(InputDataPoint.model_fields)
+
+_FLOAT_FIELDS = (
+    'sentiment_score', 'emotion_confidence', 'average_comment_sentiment',
+    'engagement_score', 'avg_session_duration', 'label_confidence',
+    'wellbeing_index'
+)
+_INT_FIELDS = (
+    'text_length', 'likes_count', 'comments_count', 'shares_count',
+    'saved_count', 'time_spent_on_post', 'comments_read_count',
+    'num_sessions_per_day', 'night_usage_minutes'
+)
+_BOOL_FIELDS = ('scrolled_back', 'recommendation_flag')
+
+# Low-cardinality string columns stored as pandas categoricals: codes
+# take a few bytes per row instead of a Python object, and groupby or
+# filtering on them works on the integer codes
+_CATEGORY_FIELDS = (
+    'day_of_week', 'time_of_day', 'emotion_primary', 'interaction_type',
+    'topic_cluster', 'image_context_label', 'label_mental_state'
+)
+
+# Keyword vocabularies and their compiled matchers are module-level
+# singletons: built once at import and shared by every DataProcessor
+# instance (uvicorn workers, per-request instantiations)
+_MENTAL_HEALTH_KEYWORDS = {
+    'anxiety': ['anxiety', 'worried', 'nervous', 'panic', 'stress', 'overwhelmed'],
+    'depression': ['depressed', 'sad', 'down', 'hopeless', 'empty', 'worthless'],
+    'stress': ['stressed', 'pressure', 'deadline', 'overwhelmed', 'burnout', 'exhausted']
+}
+
+# One compiled alternation per category, applied vectorized below
+_MH_PATTERNS = {
+    category: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for category, keywords in _MENTAL_HEALTH_KEYWORDS.items()
+}
+
+# Stress-related vocabulary for topic analysis
+_STRESS_WORDS = (
+    'workload', 'deadline', 'sleep', 'balance', 'family',
+    'exercise', 'burnout', 'pressure', 'stress', 'tired',
+    'overwhelmed', 'anxious', 'worried', 'exhausted'
+)
+_STRESS_SET = frozenset(_STRESS_WORDS)
+# \w+ keeps digits and underscores inside tokens, matching the original
+# punctuation-strip-and-split boundaries ('work_stress' is one token,
+# not a 'stress' hit)
+_TOKEN_RE = re.compile(r'\w+')
+
+_COLUMN_DTYPES = {f: np.float64 for f in _FLOAT_FIELDS}
+_COLUMN_DTYPES.update({f: np.int64 for f in _INT_FIELDS})
+_COLUMN_DTYPES.update({f: np.bool_ for f in _BOOL_FIELDS})
+
+# Numeric columns aggregated per day: the first three are averaged,
+# the rest are summed
+_DAILY_MEAN_COLS = ('sentiment_score', 'engagement_score', 'wellbeing_index')
+_DAILY_SUM_COLS = (
+    'likes_count', 'comments_count', 'shares_count',
+    'time_spent_on_post', 'night_usage_minutes'
+)
+_DAILY_AGG_COLS = _DAILY_MEAN_COLS + _DAILY_SUM_COLS
+
+# Wellbeing status thresholds, looked up branchless via searchsorted
+_WELLBEING_BINS = np.array([40.0, 60.0, 80.0])
+_WELLBEING_STATUSES = ('Needs Attention', 'Stable', 'Good', 'Excellent')
+
+class DataProcessor:
+    """Processes input data and prepares it for OpenAI analysis"""
+    
+    def process_data(self, data_points: List[InputDataPoint]) -> Dict[str, Any]:
+        """Process raw data points and extract insights"""
+        # Build column-oriented data instead of a list of per-row dicts, so
+        # pandas gets explicit dtypes and skips per-row type inference
+        cols = {f: [] for f in _FIELDS}
+        for dp in data_points:
+            # Read model fields straight from the backing __dict__: the
+            # fields are all scalars, so the recursive copy that .dict()
+            # performs buys nothing
+            values = dp if isinstance(dp, dict) else dp.__dict__
+            for f in _FIELDS:
+                cols[f].append(values[f])
+
+        # Parse timestamps once, before DataFrame construction
+        cols['timestamp'] = pd.to_datetime(cols['timestamp'], utc=True)
+
+        df = pd.DataFrame({
+            f: np.asarray(v, dtype=_COLUMN_DTYPES[f]) if f in _COLUMN_DTYPES else v
+            for f, v in cols.items()
+        })
+        for c in _CATEGORY_FIELDS:
+            df[c] = df[c].astype('category')
+
+        # Sort by timestamp
+        df = df.sort_values('timestamp')
+        
+        # Calculate daily aggregates and overall wellbeing in one pass
+        daily_data, wellbeing_metrics = self._aggregate_daily_metrics(df)
+
+        # Build the combined caption+hashtags text once and share it across
+        # both keyword scans instead of rebuilding per consumer
+        combined_text = (
+            df['caption_text'].astype(str) + ' ' + df['hashtags'].astype(str)
+        ).str.lower()
+
+        # Extract mental health indicators
+        mental_health_indicators = self._extract_mental_health_indicators(combined_text, len(df))
+
+        # Analyze engagement patterns
+        engagement_patterns = self._analyze_engagement_patterns(df)
+
+        # Extract topic analysis
+        topic_analysis = self._analyze_topics(combined_text)
+
+        # Only the derived aggregates are returned; keeping the full
+        # DataFrame alive here would pin its backing arrays through the
+        # downstream awaits and serialization
+        return {
+            'daily_data': daily_data,
+            'mental_health_indicators': mental_health_indicators,
+            'engagement_patterns': engagement_patterns,
+            'topic_analysis': topic_analysis,
+            'wellbeing_metrics': wellbeing_metrics
+        }
+    
+    def _aggregate_daily_metrics(self, df: pd.DataFrame) -> tuple:
+        """Calculate daily aggregated metrics and overall wellbeing metrics
+        in a single pass over the numeric columns"""
+        # The frame is already sorted by timestamp, so first-appearance
+        # factorization yields chronological day codes without a re-sort
+        codes, uniques = pd.factorize(df['timestamp'].dt.floor('D'))
+        values = df[list(_DAILY_AGG_COLS)].to_numpy(dtype=np.float64)
+
+        # Scatter-add per-day sums, then derive means from group counts
+        sums = np.zeros((len(uniques), values.shape[1]))
+        np.add.at(sums, codes, values)
+        counts = np.bincount(codes, minlength=len(uniques)).astype(np.float64)
+
+        # Render date strings and round sentiment vectorized here, so
+        # prepare_chart_data can pass values straight through
+        date_strings = uniques.strftime('%Y-%m-%d')
+
+        daily_data = []
+        for i, date in enumerate(date_strings):
+            row = {'date': date}
+            for j, col in enumerate(_DAILY_MEAN_COLS):
+                row[col] = float(sums[i, j] / counts[i])
+            row['sentiment_score'] = round(row['sentiment_score'], 1)
+            for j, col in enumerate(_DAILY_SUM_COLS, start=len(_DAILY_MEAN_COLS)):
+                row[col] = int(sums[i, j])
+            daily_data.append(row)
+
+        # Global means come from the same per-day totals, avoiding a
+        # second sweep over the full frame
+        totals = sums.sum(axis=0)
+        total_posts = float(len(df))
+        avg_sentiment = totals[0] / total_posts
+        avg_engagement = totals[1] / total_posts
+        avg_wellbeing = totals[2] / total_posts
+
+        # Determine status based on wellbeing score
+        status = _WELLBEING_STATUSES[
+            int(np.searchsorted(_WELLBEING_BINS, avg_wellbeing, side='right'))
+        ]
+
+        wellbeing_metrics = {
+            'wellbeing_score': float(avg_wellbeing),
+            'sentiment_score': float(avg_sentiment),
+            'engagement_score': float(avg_engagement),
+            'status': status
+        }
+
+        return daily_data, wellbeing_metrics
+    
+    def _extract_mental_health_indicators(self, combined: pd.Series, total_posts: int) -> Dict[str, float]:
+        """Extract mental health category percentages"""
+        categories = {}
+        for category in ('Anxiety', 'Stress', 'Depression'):
+            pattern = _MH_PATTERNS[category.lower()]
+            matched = combined.str.contains(pattern, regex=True, na=False).sum()
+            categories[category] = (int(matched) / total_posts) * 100
+
+        return categories
+    
+    def _analyze_engagement_patterns(self, df: pd.DataFrame, top_n: int = 5) -> List[Dict[str, Any]]:
+        """Analyze engagement vs mood patterns for the first top_n posts"""
+        # The chart only shows top_n points, so restrict extraction up
+        # front instead of building N patterns and discarding N - top_n
+        head = df.head(top_n)
+
+        # Pull just the three needed columns; the columns are already
+        # int64/float64 from the columnar build, and tolist() yields
+        # native Python scalars without per-element int()/float() casts
+        likes = head['likes_count'].to_numpy(dtype=np.int64, copy=False).tolist()
+        comments = head['comments_count'].to_numpy(dtype=np.int64, copy=False).tolist()
+        tone = head['sentiment_score'].to_numpy(dtype=np.float64, copy=False).tolist()
+
+        return [
+            {
+                'likes': likes[i],
+                'comments': comments[i],
+                'emotional_tone': tone[i]
+            }
+            for i in range(len(head))
+        ]
+    
+    def _analyze_topics(self, combined: pd.Series) -> List[Dict[str, Any]]:
+        """Extract stress-related words and their frequencies"""
+        # Tokenize every row in one C-backed findall, then keep only
+        # whitelisted stress words and count them vectorized
+        tokens = combined.str.findall(_TOKEN_RE).explode()
+        freq = tokens[tokens.isin(_STRESS_SET)].value_counts().head(7)
+
+        return [{'word': word, 'frequency': int(count)} for word, count in freq.items()]
+    
+    def prepare_chart_data(self, processed_data: Dict[str, Any]) -> Dict[str, ChartData]:
+        """Prepare data in the required chart format"""
+        daily_data = processed_data['daily_data']
+        mental_health = processed_data['mental_health_indicators']
+        engagement = processed_data['engagement_patterns']
+        topics = processed_data['topic_analysis']
+        wellbeing = processed_data['wellbeing_metrics']
+        
+        # All values here were produced by our own aggregation with the
+        # right native types, so model_construct skips redundant
+        # per-point Pydantic validation
+
+        # Emotional trend chart
+        emotional_trend_data = [
+            ChartDataPoint.model_construct(
+                date=day['date'],
+                sentiment_score=day['sentiment_score']
+            )
+            for day in daily_data
+        ]
+
+        # Mental health categories chart
+        mental_health_data = [
+            ChartDataPoint.model_construct(
+                category=category,
+                percentage=round(percentage, 1)
+            )
+            for category, percentage in mental_health.items()
+        ]
+
+        # Engagement vs mood chart
+        engagement_data = [
+            ChartDataPoint.model_construct(
+                likes=pattern['likes'],
+                comments=pattern['comments'],
+                emotional_tone=round(pattern['emotional_tone'], 1)
+            )
+            for pattern in engagement  # Already limited to 5 points by the producer
+        ]
+
+        # Topics discussed chart
+        topics_data = [
+            ChartDataPoint.model_construct(
+                word=topic['word'],
+                frequency=topic['frequency']
+            )
+            for topic in topics
+        ]
+        
+        # Wellbeing index chart
+        wellbeing_data = ChartData(
+            chart_type="gauge",
+            title="Overall Wellbeing Score",
+            data=[],
+            value=round(wellbeing['wellbeing_score'], 1),
+            range={"min": 0, "max": 100},
+            status=wellbeing['status']
+        )
+        
+        # Recommendations (will be generated by OpenAI)
+        recommendations_data = ChartData(
+            chart_type="text_cards",
+            title="Personalized Suggestions",
+            data=[]
+        )
+        
+        return {
+            'emotional_trend': ChartData(
+                chart_type="line",
+                title="Daily Sentiment Over Time",
+                data=emotional_trend_data
+            ),
+            'mental_health_categories': ChartData(
+                chart_type="pie",
+                title="Distribution of Anxiety/Stress/Depression Indicators",
+                data=mental_health_data
+            ),
+            'engagement_vs_mood': ChartData(
+                chart_type="scatter",
+                title="Engagement vs Mood",
+                data=engagement_data
+            ),
+            'topics_discussed': ChartData(
+                chart_type="word_cloud",
+                title="Top Stress-Related Words",
+                data=topics_data
+            ),
+            'wellbeing_index': wellbeing_data,
+            'recommendations': recommendations_data
+        }
@@ -1,289 +1,420 @@
-import json
-from typing import Dict, Any, List
-from openai import OpenAI
-from config import settings
-from models import AnalysisResponse, ChartData, ChartDataPoint
-from data_processor import DataProcessor
-from datetime import datetime, timedelta
-import random
-import re
-
-class OpenAIService:
-    """Service for interacting with OpenAI API to generate mental health insights"""
-    
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.data_processor = DataProcessor()
-    
-    async def analyze_mental_health_data(self, data_points: List[Dict[str, Any]]) -> AnalysisResponse:
-        """Analyze mental health data using OpenAI and return structured response"""
-        
-        # Process the data first
-        processed_data = self.data_processor.process_data(data_points)
-        chart_data = self.data_processor.prepare_chart_data(processed_data)
-        
-        # Prepare context for OpenAI
-        context = self._prepare_analysis_context(processed_data)
-        
-        # Generate recommendations using OpenAI
-        recommendations = await self._generate_recommendations(context)
-        
-        # Update recommendations in chart data
-        chart_data['recommendations'].data = [
-            ChartDataPoint(id=i+1, text=rec) 
-            for i, rec in enumerate(recommendations)
-        ]
-        
-        return AnalysisResponse(
-            emotional_trend=chart_data['emotional_trend'],
-            mental_health_categories=chart_data['mental_health_categories'],
-            engagement_vs_mood=chart_data['engagement_vs_mood'],
-            topics_discussed=chart_data['topics_discussed'],
-            wellbeing_index=chart_data['wellbeing_index'],
-            recommendations=chart_data['recommendations']
-        )
-    
-    async def generate_sample_data(self, num_posts: int = 10, analysis_period_days: int = 7) -> List[Dict[str, Any]]:
-        """Generate realistic sample data using OpenAI"""
-        
-        system_prompt = """You are a data generator for mental health analysis. Generate realistic social media posts that would be used for mental health analysis.
-        
-        For each post, generate data that includes:
-        - Realistic captions about daily life, work, relationships, health, etc.
-        - Appropriate hashtags
-        - Sentiment scores (0-100)
-        - Engagement metrics (likes, comments, shares)
-        - Mental health indicators
-        - Wellbeing scores
-        
-        Make the data realistic and varied - some positive posts, some stressful, some neutral.
-        Include posts about work stress, relationships, fitness, sleep, family, etc.
-        """
-        
-        user_prompt = f"""Generate {num_posts} realistic social media posts for mental health analysis.
-        
-        Each post should have all these fields:
-        - post_id: unique identifier
-        - user_id: "user_123"
-        - timestamp: ISO format within last {analysis_period_days} days
-        - day_of_week: day name
-        - time_of_day: "morning", "afternoon", or "evening"
-        - caption_text: realistic social media caption
-        - hashtags: relevant hashtags
-        - image_context_label: context like "office_desk", "gym", "home", "outdoor", "social_gathering"
-        - sentiment_score: 0-100
-        - emotion_primary: "positive", "mixed", "negative", "neutral"
-        - emotion_confidence: 0.7-1.0
-        - topic_cluster: "work_stress", "fitness_wellness", "social_connection", "sleep_issues", "family_time"
-        - text_length: character count
-        - likes_count: 5-50
-        - comments_count: 0-15
-        - shares_count: 0-8
-        - saved_count: 0-5
-        - average_comment_sentiment: 0-100
-        - engagement_score: 30-95
-        - time_spent_on_post: 30-300 seconds
-        - comments_read_count: 0-10
-        - scrolled_back: true/false
-        - interaction_type: "post_creation"
-        - num_sessions_per_day: 5-15
-        - avg_session_duration: 8-25 minutes
-        - night_usage_minutes: 10-120
-        - label_mental_state: "positive", "stressed", "anxious", "depressed", "neutral"
-        - label_confidence: 0.7-1.0
-        - wellbeing_index: 30-90
-        - recommendation_flag: true/false
-        
-        Return as a JSON array of objects.
-        """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.8,
-                max_tokens=4000
-            )
-            
-            generated_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            try:
-                sample_data = json.loads(generated_text)
-                if isinstance(sample_data, list) and len(sample_data) >= num_posts:
-                    return sample_data[:num_posts]
-                else:
-                    return self._get_fallback_sample_data(num_posts)
-            except json.JSONDecodeError:
-                return self._get_fallback_sample_data(num_posts)
-                
-        except Exception as e:
-            print(f"Error generating sample data with OpenAI: {e}")
-            return self._get_fallback_sample_data(num_posts)
-    
-    def _get_fallback_sample_data(self, num_posts: int) -> List[Dict[str, Any]]:
-        """Fallback sample data if OpenAI fails"""
-        sample_data = []
-        
-        captions = [
-            "Feeling overwhelmed with work today, but trying to stay positive! #work #stress #motivation",
-            "Great workout session! Feeling much better now. #fitness #wellness #selfcare",
-            "Had a rough day, but grateful for my friends who always support me. #grateful #friends #support",
-            "Can't sleep again... too much on my mind. #insomnia #anxiety #sleep",
-            "Celebrating a small win at work today! #achievement #work #success",
-            "Feeling lonely lately, need to reach out to people more. #loneliness #social #connection",
-            "Beautiful sunset walk helped clear my mind. #nature #mindfulness #peace",
-            "Stressed about the upcoming presentation, but I'll get through it. #presentation #stress #confidence",
-            "Spent quality time with family today, feeling blessed. #family #gratitude #love",
-            "Another day of working from home, missing the office social interaction. #wfh #isolation #work"
-        ]
-        
-        emotions = ['positive', 'mixed', 'negative', 'neutral']
-        mental_states = ['positive', 'stressed', 'anxious', 'depressed', 'neutral']
-        topics = ['work_stress', 'fitness_wellness', 'social_connection', 'sleep_issues', 'family_time']
-        
-        for i in range(num_posts):
-            timestamp = datetime.now() - timedelta(days=random.randint(0, 6), hours=random.randint(0, 23))
-            caption = random.choice(captions)
-            emotion = random.choice(emotions)
-            mental_state = random.choice(mental_states)
-            topic = random.choice(topics)
-            
-            # Extract hashtags from caption using regex
-            hashtags = ' '.join(re.findall(r'#\w+', caption))
-            
-            sample_data.append({
-                "post_id": f"post_{i+1:03d}",
-                "user_id": "user_123",
-                "timestamp": timestamp.isoformat() + "Z",
-                "day_of_week": timestamp.strftime("%A"),
-                "time_of_day": "morning" if timestamp.hour < 12 else "afternoon" if timestamp.hour < 18 else "evening",
-                "caption_text": caption,
-                "hashtags": hashtags,
-                "image_context_label": random.choice(["office_desk", "gym", "home", "outdoor", "social_gathering"]),
-                "sentiment_score": round(random.uniform(20, 80), 1),
-                "emotion_primary": emotion,
-                "emotion_confidence": round(random.uniform(0.7, 1.0), 2),
-                "topic_cluster": topic,
-                "text_length": len(caption),
-                "likes_count": random.randint(5, 50),
-                "comments_count": random.randint(0, 15),
-                "shares_count": random.randint(0, 8),
-                "saved_count": random.randint(0, 5),
-                "average_comment_sentiment": round(random.uniform(20, 80), 1),
-                "engagement_score": round(random.uniform(30, 95), 1),
-                "time_spent_on_post": random.randint(30, 300),
-                "comments_read_count": random.randint(0, 10),
-                "scrolled_back": random.choice([True, False]),
-                "interaction_type": "post_creation",
-                "num_sessions_per_day": random.randint(5, 15),
-                "avg_session_duration": round(random.uniform(8, 25), 1),
-                "night_usage_minutes": random.randint(10, 120),
-                "label_mental_state": mental_state,
-                "label_confidence": round(random.uniform(0.7, 1.0), 2),
-                "wellbeing_index": round(random.uniform(30, 90), 1),
-                "recommendation_flag": random.choice([True, False])
-            })
-        
-        return sample_data
-    
-    def _prepare_analysis_context(self, processed_data: Dict[str, Any]) -> str:
-        """Prepare context string for OpenAI analysis"""
-        daily_data = processed_data['daily_data']
-        mental_health = processed_data['mental_health_indicators']
-        wellbeing = processed_data['wellbeing_metrics']
-        topics = processed_data['topic_analysis']
-        
-        context = f"""
-        Mental Health Analysis Context:
-        
-        Daily Sentiment Trends:
-        {json.dumps(daily_data, indent=2, default=str)}
-        
-        Mental Health Category Distribution:
-        {json.dumps(mental_health, indent=2)}
-        
-        Wellbeing Metrics:
-        - Overall Wellbeing Score: {wellbeing['wellbeing_score']:.1f}/100
-        - Average Sentiment: {wellbeing['sentiment_score']:.1f}/100
-        - Engagement Score: {wellbeing['engagement_score']:.1f}/100
-        - Status: {wellbeing['status']}
-        
-        Top Stress-Related Topics:
-        {json.dumps(topics, indent=2)}
-        
-        Analysis Period: {len(daily_data)} days
-        """
-        
-        return context
-    
-    async def _generate_recommendations(self, context: str) -> List[str]:
-        """Generate personalized recommendations using OpenAI"""
-        
-        system_prompt = """You are a mental health AI assistant specializing in social media and digital wellness analysis. 
-        Based on the provided data about a user's social media posts, engagement patterns, and wellbeing metrics, 
-        generate 4 personalized, actionable recommendations to improve their mental health and digital wellness.
-        
-        Focus on:
-        1. Practical, implementable suggestions
-        2. Digital wellness and screen time management
-        3. Mental health improvement strategies
-        4. Social connection and engagement optimization
-        
-        Keep recommendations concise (1-2 sentences each) and encouraging in tone.
-        """
-        
-        user_prompt = f"""
-        Please analyze this mental health data and provide 4 personalized recommendations:
-        
-        {context}
-        
-        Return only the recommendations as a JSON array of strings, no additional text.
-        Example format: ["Recommendation 1", "Recommendation 2", "Recommendation 3", "Recommendation 4"]
-        """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            recommendations_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            try:
-                recommendations = json.loads(recommendations_text)
-                if isinstance(recommendations, list) and len(recommendations) >= 4:
-                    return recommendations[:4]  # Ensure we have exactly 4
-                else:
-                    return self._get_fallback_recommendations()
-            except json.JSONDecodeError:
-                return self._get_fallback_recommendations()
-                
-        except Exception as e:
-            print(f"Error generating recommendations: {e}")
-            return self._get_fallback_recommendations()
-    
-    def _get_fallback_recommendations(self) -> List[str]:
-        """Fallback recommendations if OpenAI fails"""
-        return [
-            "Try a 10-minute mindfulness meditation before starting your day.",
-            "Take a short walk after lunch to reduce mid-day stress.",
-            "Limit late-night screen time to improve sleep quality.",
-            "Reach out to a friend or colleague for social connection."
-        ]
-    
-    async def enhance_analysis_with_ai(self, chart_data: Dict[str, ChartData]) -> Dict[str, ChartData]:
-        """Enhance the analysis with AI-generated insights"""
-        
-        # This could be expanded to use AI for more sophisticated analysis
-        # For now, we'll return the processed data as-is
+import asyncio
+import hashlib
+import httpx
+import orjson
+import re
+from typing import Dict, Any, List
+from openai import AsyncOpenAI
+from config import settings
+from models import AnalysisResponse, ChartData, ChartDataPoint, GeneratedPostList
+from data_processor import DataProcessor
+from sample_gen import generate_sample_posts
+
+# Salvages quoted strings from a truncated recommendation payload; the
+# length bounds skip JSON keys and other short fragments
+_REC_STRING_RE = re.compile(r'"([^"\\]{5,200})"')
+
+# Posts per Batch API request line: a 30-field post runs roughly 150-200
+# output tokens, so 20 per completion stays safely inside the 4000-token
+# budget where one line for the whole generation would be truncated
+_BATCH_POSTS_PER_LINE = 20
+
+# Parsed LLM responses cached by a hash of everything that shapes the
+# completion; identical contexts (retries, repeated test runs) skip the
+# network round-trip and its token cost entirely
+_llm_cache: Dict[str, Any] = {}
+_llm_cache_lock = asyncio.Lock()
+_LLM_CACHE_MAX = 128
+
+# System prompts are module-level constants with no interpolated values:
+# OpenAI's prompt cache keys on exact prefixes, so keeping these
+# byte-identical across calls lets the server reuse the cached prefix.
+# All variable data goes in the user message.
+_SYS_GEN = """You are a data generator for mental health analysis. Generate realistic social media posts that would be used for mental health analysis.
+
+For each post, generate data that includes:
+- Realistic captions about daily life, work, relationships, health, etc.
+- Appropriate hashtags
+- Sentiment scores (0-100)
+- Engagement metrics (likes, comments, shares)
+- Mental health indicators
+- Wellbeing scores
+
+Make the data realistic and varied - some positive posts, some stressful, some neutral.
+Include posts about work stress, relationships, fitness, sleep, family, etc.
+"""
+
+_SYS_RECS = """You are a mental health AI assistant specializing in social media and digital wellness analysis. 
+Based on the provided data about a user's social media posts, engagement patterns, and wellbeing metrics, 
+generate 4 personalized, actionable recommendations to improve their mental health and digital wellness.
+
+Focus on:
+1. Practical, implementable suggestions
+2. Digital wellness and screen time management
+3. Mental health improvement strategies
+4. Social connection and engagement optimization
+
+Keep recommendations concise (1-2 sentences each) and encouraging in tone.
+"""
+
+def _strict_schema(schema):
+    """Rewrite a Pydantic JSON schema in place for OpenAI strict mode
+
+    Strict structured outputs require additionalProperties: false on
+    every object and reject annotations like string formats, neither of
+    which Pydantic emits by default.
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") == "object":
+            schema["additionalProperties"] = False
+        schema.pop("format", None)
+        for value in schema.values():
+            _strict_schema(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            _strict_schema(value)
+    return schema
+
+# The full 30-field post schema rides along as a structured-output spec
+# instead of a bulleted field list in the user prompt, cutting input
+# tokens per call and guaranteeing parseable JSON
+_SAMPLE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "generated_posts",
+        "schema": _strict_schema(GeneratedPostList.model_json_schema()),
+        "strict": True
+    }
+}
+
+# One long-lived OpenAI client per process: every OpenAIService shares
+# its connection pool, so TLS sessions are reused across requests even
+# if service instances are created per request
+_openai_client = None
+
+def _get_openai_client() -> AsyncOpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+        )
+    return _openai_client
+
+def _llm_cache_key(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+    payload = f"{model}|{temperature}|{system_prompt}|{user_prompt}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+async def _llm_cache_get(key: str):
+    async with _llm_cache_lock:
+        return _llm_cache.get(key)
+
+async def _llm_cache_put(key: str, value) -> None:
+    async with _llm_cache_lock:
+        if len(_llm_cache) >= _LLM_CACHE_MAX:
+            _llm_cache.pop(next(iter(_llm_cache)))
+        _llm_cache[key] = value
+
+class OpenAIService:
+    """Service for interacting with OpenAI API to generate mental health insights"""
+    
+    def __init__(self):
+        # Resolved once here so per-call guards are a plain attribute
+        # read; without a key there is no point constructing a client
+        # (or paying for a doomed TLS round-trip on every request)
+        self._enabled = bool(settings.OPENAI_API_KEY)
+        self.client = _get_openai_client() if self._enabled else None
+        self.data_processor = DataProcessor()
+    
+    async def analyze_mental_health_data(self, data_points: List[Dict[str, Any]]) -> AnalysisResponse:
+        """Analyze mental health data using OpenAI and return structured response"""
+        
+        # Process the data first
+        processed_data = self.data_processor.process_data(data_points)
+        chart_data = self.data_processor.prepare_chart_data(processed_data)
+        
+        # Prepare context for OpenAI; the JSON rendering is pure-Python
+        # CPU work, so push it off the event loop
+        context = await asyncio.to_thread(self._prepare_analysis_context, processed_data)
+        
+        # Generate recommendations using OpenAI
+        recommendations = await self._generate_recommendations(context)
+        
+        # Update recommendations in chart data; model_construct skips
+        # validation, which is safe for these internally built values
+        chart_data['recommendations'].data = [
+            ChartDataPoint.model_construct(id=i, text=rec)
+            for i, rec in enumerate(recommendations, start=1)
+        ]
+        
+        return AnalysisResponse(
+            emotional_trend=chart_data['emotional_trend'],
+            mental_health_categories=chart_data['mental_health_categories'],
+            engagement_vs_mood=chart_data['engagement_vs_mood'],
+            topics_discussed=chart_data['topics_discussed'],
+            wellbeing_index=chart_data['wellbeing_index'],
+            recommendations=chart_data['recommendations']
+        )
+    
+    async def generate_sample_data(self, num_posts: int = 10, analysis_period_days: int = 7) -> List[Dict[str, Any]]:
+        """Generate realistic sample data using OpenAI"""
+
+        if not self._enabled:
+            return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+        user_prompt = (
+            f"Generate {num_posts} realistic social media posts for user_123, "
+            f"timestamped within the last {analysis_period_days} days. "
+            "Vary sentiment, engagement and topics across the posts."
+        )
+        
+        cache_key = _llm_cache_key(settings.OPENAI_MODEL, 0.8, _SYS_GEN, user_prompt)
+        cached = await _llm_cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Large generations are not latency-sensitive, so route them
+        # through the discounted Batch API
+        if num_posts >= settings.OPENAI_BATCH_THRESHOLD:
+            return await self._generate_sample_data_batch(num_posts, analysis_period_days)
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": _SYS_GEN},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.8,
+                max_tokens=4000,
+                response_format=_SAMPLE_RESPONSE_FORMAT,
+                stream=True
+            )
+
+            # Accumulate chunk contents in a list (repeated string
+            # concatenation would be quadratic) and track bracket depth so
+            # a parse is only attempted once the payload can be complete
+            chunks = []
+            depth = 0
+            parsed = None
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+                depth += delta.count('{') + delta.count('[')
+                depth -= delta.count('}') + delta.count(']')
+                if depth == 0:
+                    try:
+                        parsed = orjson.loads(''.join(chunks).strip())
+                    except orjson.JSONDecodeError:
+                        continue
+                    # Close the response before breaking out so the
+                    # connection goes back to the shared pool instead of
+                    # lingering until GC
+                    await stream.close()
+                    break
+
+            if parsed is None:
+                try:
+                    parsed = orjson.loads(''.join(chunks).strip())
+                except orjson.JSONDecodeError:
+                    return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+            sample_data = parsed.get("posts") if isinstance(parsed, dict) else parsed
+            if isinstance(sample_data, list) and len(sample_data) >= num_posts:
+                sample_data = sample_data[:num_posts]
+                await _llm_cache_put(cache_key, sample_data)
+                return list(sample_data)
+            return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+        except Exception as e:
+            print(f"Error generating sample data with OpenAI: {e}")
+            return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+    
+    async def _generate_sample_data_batch(self, num_posts: int, analysis_period_days: int) -> List[Dict[str, Any]]:
+        """Generate a large sample dataset through the OpenAI Batch API
+
+        Intended for offline/nightly precomputation: batch requests cost
+        roughly half as much as live completions but can take minutes to
+        complete, so this polls with a bounded timeout and falls back to
+        locally generated data if the batch does not finish in time.
+
+        The generation is split across one JSONL request line per
+        _BATCH_POSTS_PER_LINE posts: a single completion for 100+ posts
+        would blow through any max_tokens budget and come back truncated.
+        """
+        sizes = [_BATCH_POSTS_PER_LINE] * (num_posts // _BATCH_POSTS_PER_LINE)
+        if num_posts % _BATCH_POSTS_PER_LINE:
+            sizes.append(num_posts % _BATCH_POSTS_PER_LINE)
+
+        request_lines = b"".join(
+            orjson.dumps({
+                "custom_id": f"sample-data-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.OPENAI_MODEL,
+                    "messages": [
+                        {"role": "system", "content": _SYS_GEN},
+                        {"role": "user", "content": (
+                            f"Generate {size} realistic social media posts for user_123, "
+                            f"timestamped within the last {analysis_period_days} days. "
+                            "Vary sentiment, engagement and topics across the posts."
+                        )}
+                    ],
+                    "temperature": 0.8,
+                    "max_tokens": 4000,
+                    "response_format": _SAMPLE_RESPONSE_FORMAT
+                }
+            }) + b"\n"
+            for i, size in enumerate(sizes)
+        )
+
+        try:
+            input_file = await self.client.files.create(
+                file=("sample_data_batch.jsonl", request_lines),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                endpoint="/v1/chat/completions",
+                input_file_id=input_file.id,
+                completion_window="24h"
+            )
+
+            deadline = asyncio.get_running_loop().time() + settings.OPENAI_BATCH_TIMEOUT_SECONDS
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if asyncio.get_running_loop().time() >= deadline:
+                    print(f"Batch {batch.id} timed out in status {batch.status}")
+                    return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+                await asyncio.sleep(settings.OPENAI_BATCH_POLL_SECONDS)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                print(f"Batch {batch.id} ended in status {batch.status}")
+                return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+            # Output lines are not ordered; reassemble chunks by the
+            # index carried in each custom_id
+            chunks: Dict[int, List[Dict[str, Any]]] = {}
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                try:
+                    result = orjson.loads(line)
+                    content = result["response"]["body"]["choices"][0]["message"]["content"]
+                    parsed = orjson.loads(content.strip())
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    continue
+                posts = parsed.get("posts") if isinstance(parsed, dict) else parsed
+                if isinstance(posts, list):
+                    chunks[int(result["custom_id"].rsplit("-", 1)[1])] = posts
+
+            sample_data = [
+                post for _, posts in sorted(chunks.items()) for post in posts
+            ]
+            if len(sample_data) >= num_posts:
+                return sample_data[:num_posts]
+
+            return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+        except Exception as e:
+            print(f"Error generating sample data via Batch API: {e}")
+            return await asyncio.to_thread(self._get_fallback_sample_data, num_posts)
+
+    def _get_fallback_sample_data(self, num_posts: int) -> List[Dict[str, Any]]:
+        """Fallback sample data if OpenAI fails"""
+        return generate_sample_posts(num_posts)
+
+    def _prepare_analysis_context(self, processed_data: Dict[str, Any]) -> str:
+        """Prepare context string for OpenAI analysis"""
+        daily_data = processed_data['daily_data']
+        mental_health = processed_data['mental_health_indicators']
+        wellbeing = processed_data['wellbeing_metrics']
+        topics = processed_data['topic_analysis']
+        
+        # Single-line JSON and one-line metrics: indentation would only
+        # add whitespace tokens the model has to pay to read
+        context = f"""Mental Health Analysis Context:
+Daily Sentiment Trends: {orjson.dumps(daily_data).decode()}
+Mental Health Category Distribution: {orjson.dumps(mental_health).decode()}
+Wellbeing {wellbeing['wellbeing_score']:.1f}/100, Sentiment {wellbeing['sentiment_score']:.1f}/100, Engagement {wellbeing['engagement_score']:.1f}/100 [{wellbeing['status']}]
+Top Stress-Related Topics: {orjson.dumps(topics).decode()}
+Analysis Period: {len(daily_data)} days"""
+
+        return context
+    
+    async def _generate_recommendations(self, context: str) -> List[str]:
+        """Generate personalized recommendations using OpenAI"""
+
+        if not self._enabled:
+            return self._get_fallback_recommendations()
+
+        user_prompt = f"""
+        Please analyze this mental health data and provide 4 personalized recommendations:
+        
+        {context}
+        
+        Return only the recommendations as a JSON array of strings, no additional text.
+        Example format: ["Recommendation 1", "Recommendation 2", "Recommendation 3", "Recommendation 4"]
+        """
+        
+        cache_key = _llm_cache_key(settings.OPENAI_RECS_MODEL, 0.7, _SYS_RECS, user_prompt)
+        cached = await _llm_cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=settings.OPENAI_RECS_MODEL,
+                messages=[
+                    {"role": "system", "content": _SYS_RECS},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.7,
+                max_tokens=300
+            )
+            
+            recommendations_text = response.choices[0].message.content.strip()
+            
+            # Parse JSON response
+            try:
+                recommendations = orjson.loads(recommendations_text)
+                if isinstance(recommendations, list) and len(recommendations) >= 4:
+                    recommendations = recommendations[:4]  # Ensure we have exactly 4
+                    await _llm_cache_put(cache_key, recommendations)
+                    return list(recommendations)
+                else:
+                    return self._get_fallback_recommendations()
+            except orjson.JSONDecodeError:
+                # max_tokens can cut the array off mid-string; salvage
+                # whatever complete strings made it through rather than
+                # discarding the paid-for response. Salvaged results are
+                # not cached since they came from a malformed payload.
+                salvaged = _REC_STRING_RE.findall(recommendations_text)
+                if len(salvaged) >= 4:
+                    return salvaged[:4]
+                return self._get_fallback_recommendations()
+                
+        except Exception as e:
+            print(f"Error generating recommendations: {e}")
+            return self._get_fallback_recommendations()
+    
+    def _get_fallback_recommendations(self) -> List[str]:
+        """Fallback recommendations if OpenAI fails"""
+        return [
+            "Try a 10-minute mindfulness meditation before starting your day.",
+            "Take a short walk after lunch to reduce mid-day stress.",
+            "Limit late-night screen time to improve sleep quality.",
+            "Reach out to a friend or colleague for social connection."
+        ]
+    
+    async def enhance_analysis_with_ai(self, chart_data: Dict[str, ChartData]) -> Dict[str, ChartData]:
+        """Enhance the analysis with AI-generated insights"""
+        
+        # This could be expanded to use AI for more sophisticated analysis
+        # For now, we'll return the processed data as-is
         return chart_data
\ No newline at end of file